@@ -8,6 +8,15 @@ def get_version():
         return buff.read()
 
 
+def get_ext_modules():
+    """Get the AOT-compiled numba kernels, if numba is available at build time."""
+    try:
+        from wildfire.models.threshold_model._kernels_aot import cc
+    except ImportError:
+        return []
+    return [cc.distutils_extension()]
+
+
 setup(
     name="wildfire",
     version=get_version(),
@@ -16,6 +25,7 @@ setup(
     author_email="",
     packages=find_packages(),
     include_package_data=True,
+    ext_modules=get_ext_modules(),
     description="Modelling characteristics of wildfires",
     long_description="\n" + open("README.md").read(),
     entry_points={
@@ -22,4 +22,4 @@ def test_goes_threshold(goes_level_2):
             ],
         )
         assert actual.exit_code == 0
-        assert len(glob.glob(os.path.join(temporary_directory, "*.json"))) == 1
+        assert len(glob.glob(os.path.join(temporary_directory, "*.jsonl"))) == 1
@@ -1,5 +1,6 @@
 import datetime
 import os
+import shutil
 import tempfile
 
 import numpy as np
@@ -83,6 +84,25 @@ def test_read_netcdf(goes_level_1_filepaths_no_wildfire):
     assert isinstance(actual, goes_level_1.GoesBand)
 
 
+def test_read_netcdf_zarr_cache(goes_level_1_filepaths_no_wildfire):
+    source_filepath = goes_level_1_filepaths_no_wildfire[0]
+    with tempfile.TemporaryDirectory() as temp_directory:
+        local_filepath = os.path.join(temp_directory, os.path.basename(source_filepath))
+        shutil.copy(source_filepath, local_filepath)
+
+        actual = goes_level_1.read_netcdf(
+            local_filepath=local_filepath, zarr_cache=True
+        )
+        assert isinstance(actual, goes_level_1.GoesBand)
+        assert os.path.exists(f"{local_filepath}.zarr")
+
+        cached = goes_level_1.read_netcdf(
+            local_filepath=local_filepath, zarr_cache=True
+        )
+        assert cached.band_id == actual.band_id
+        assert cached.scan_time_utc == actual.scan_time_utc
+
+
 def test_normalize():
     x = np.array([1, 2, 3, 4, 5])
     actual = goes_level_1.band.normalize(data=x)
@@ -0,0 +1,22 @@
+import numpy as np
+
+from wildfire.data.goes_level_1 import _kernels
+
+
+def test_brightness_temperature_matches_numpy():
+    random_state = np.random.RandomState(seed=17)
+    rad = random_state.uniform(0.5, 150, size=(100, 100)).astype(np.float32)
+    rad[0, :10] = np.nan
+    rad[1, 0] = 0.0  # zero radiance is representable and must stay finite
+    planck_fk1, planck_fk2 = 202263.0, 3698.19
+    planck_bc1, planck_bc2 = 0.5, 0.9991
+
+    actual = np.empty_like(rad)
+    _kernels.brightness_temperature(
+        rad, planck_fk1, planck_fk2, planck_bc1, planck_bc2, actual
+    )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        expected = (planck_fk2 / np.log(planck_fk1 / rad + 1) - planck_bc1) / planck_bc2
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
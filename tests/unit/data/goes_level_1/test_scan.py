@@ -62,6 +62,18 @@ def test_rescale_to_2km(goes_level_1_filepaths_no_wildfire):
         assert band_data.dataset.Rad.shape == (500, 500)
 
 
+def test_rescale_bands_to_2km(goes_level_1_filepaths_no_wildfire):
+    original = goes_level_1.read_netcdfs(goes_level_1_filepaths_no_wildfire)
+    actual = original.rescale_bands_to_2km(band_ids=[2, 7])
+    assert set(actual.keys()) == {"band_2", "band_7"}
+    for band_data in actual.values():
+        assert isinstance(band_data, goes_level_1.GoesBand)
+        assert band_data.dataset.Rad.shape == (500, 500)
+
+    with pytest.raises(ValueError):
+        original.rescale_bands_to_2km(band_ids=[0, 17])
+
+
 def test_get_goes_scan_local(goes_level_1_filepaths_no_wildfire):
     region, _, satellite, scan_time = goes_level_1.utilities.parse_filename(
         goes_level_1_filepaths_no_wildfire[0]
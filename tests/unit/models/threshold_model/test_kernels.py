@@ -0,0 +1,53 @@
+import numpy as np
+
+from wildfire.models.threshold_model import _kernels, model
+
+
+def test_classify_matches_numpy_classifiers():
+    random_state = np.random.RandomState(seed=17)
+    # deliberately larger than and not divisible by the kernel's tile size
+    shape = (700, 613)
+    brightness_temperature_3_89 = random_state.uniform(250, 350, size=shape)
+    brightness_temperature_11_19 = random_state.uniform(250, 350, size=shape)
+    brightness_temperature_12_27 = random_state.uniform(250, 350, size=shape)
+    reflectance_factor_0_64 = random_state.uniform(-0.5, 1.5, size=shape)
+    reflectance_factor_0_87 = random_state.uniform(-0.5, 1.5, size=shape)
+    reflectance_factor_2_25 = random_state.uniform(-0.5, 1.5, size=shape)
+
+    actual = model.ModelFeatures(
+        codes=_kernels.classify(
+            brightness_temperature_3_89=brightness_temperature_3_89,
+            brightness_temperature_11_19=brightness_temperature_11_19,
+            brightness_temperature_12_27=brightness_temperature_12_27,
+            reflectance_factor_0_64=reflectance_factor_0_64,
+            reflectance_factor_0_87=reflectance_factor_0_87,
+            reflectance_factor_2_25=reflectance_factor_2_25,
+        )
+    )
+
+    np.testing.assert_array_equal(
+        actual.is_hot,
+        model.is_hot_pixel(
+            brightness_temperature_3_89=brightness_temperature_3_89,
+            brightness_temperature_11_19=brightness_temperature_11_19,
+        ),
+    )
+    np.testing.assert_array_equal(
+        actual.is_night,
+        model.is_night_pixel(
+            reflectance_factor_0_64=reflectance_factor_0_64,
+            reflectance_factor_0_87=reflectance_factor_0_87,
+        ),
+    )
+    np.testing.assert_array_equal(
+        actual.is_water,
+        model.is_water_pixel(reflectance_factor_2_25=reflectance_factor_2_25),
+    )
+    np.testing.assert_array_equal(
+        actual.is_cloud,
+        model.is_cloud_pixel(
+            reflectance_factor_0_64=reflectance_factor_0_64,
+            reflectance_factor_0_87=reflectance_factor_0_87,
+            brightness_temperature_12_27=brightness_temperature_12_27,
+        ),
+    )
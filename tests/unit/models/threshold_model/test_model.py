@@ -38,3 +38,14 @@ def test_predict_bad_args():
             is_cloud=np.ones(1),
         )
         assert "Shapes do not match" in error_message
+
+
+def test_predict_packed_matches_predict():
+    codes = np.arange(16, dtype=np.uint8)
+    expected = model.predict(
+        is_hot=(codes & model.HOT_BIT) > 0,
+        is_cloud=(codes & model.CLOUD_BIT) > 0,
+        is_water=(codes & model.WATER_BIT) > 0,
+        is_night=(codes & model.NIGHT_BIT) > 0,
+    )
+    np.testing.assert_array_equal(model.predict_packed(codes=codes), expected)
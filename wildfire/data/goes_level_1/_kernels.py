@@ -0,0 +1,69 @@
+"""Numba kernel for the radiance to brightness-temperature conversion.
+
+The `log` in the Planck inversion is the arithmetic hotspot of the conversion — a
+transcendental call per pixel. The kernel below replaces it with a frexp-based
+polynomial evaluation (exponent extracted bitwise, `log` of the mantissa via the
+arctanh series), which agrees with `np.log` to ~1e-10 relative error — far tighter
+than the ~0.1 K the threshold model needs — while streaming each raster through
+memory once in parallel.
+"""
+import math
+
+import numpy as np
+from numba import njit, prange
+
+_LN_2 = 0.6931471805599453
+_SQRT_HALF = 0.7071067811865476
+
+
+@njit(inline="always")
+def _fast_log(value):
+    # value = mantissa * 2**exponent with mantissa in [0.5, 1); renormalizing the
+    # mantissa to [sqrt(0.5), sqrt(2)) keeps |t| below 0.172, where the 11th-order
+    # arctanh series is accurate to ~1e-10 relative
+    mantissa, exponent = math.frexp(value)
+    if mantissa < _SQRT_HALF:
+        mantissa *= 2.0
+        exponent -= 1
+    t = (mantissa - 1.0) / (mantissa + 1.0)
+    t2 = t * t
+    series = t * (
+        2.0
+        + t2
+        * (
+            2.0 / 3.0
+            + t2 * (2.0 / 5.0 + t2 * (2.0 / 7.0 + t2 * (2.0 / 9.0 + t2 * (2.0 / 11.0))))
+        )
+    )
+    return series + exponent * _LN_2
+
+
+# fastmath is restricted to flags that preserve NaN semantics so that masked pixels
+# propagate NaN exactly as the numpy expression does
+@njit(parallel=True, cache=True, fastmath={"contract", "arcp", "reassoc"})
+def brightness_temperature(rad, planck_fk1, planck_fk2, planck_bc1, planck_bc2, out):
+    """Convert spectral radiance to brightness temperature, pixel by pixel.
+
+    Parameters
+    ----------
+    rad : np.ndarray of float
+        Spectral radiance.
+    planck_fk1 : float
+    planck_fk2 : float
+    planck_bc1 : float
+    planck_bc2 : float
+    out : np.ndarray of float
+        Preallocated output of the same shape as `rad`; receives the brightness
+        temperature (Kelvin).
+    """
+    num_rows, num_cols = rad.shape
+    for row in prange(num_rows):  # pylint: disable=not-an-iterable
+        for col in range(num_cols):
+            value = planck_fk1 / rad[row, col] + 1.0
+            if 0.0 < value < np.inf:
+                log_value = _fast_log(value)
+            else:
+                # NaN, -inf, or inf (zero radiance), matching np.log at the edges
+                # of the domain
+                log_value = np.log(value)
+            out[row, col] = (planck_fk2 / log_value - planck_bc1) / planck_bc2
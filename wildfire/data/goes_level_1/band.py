@@ -1,10 +1,11 @@
 """Wrapper around the a single band from a GOES Level 1 satellite scan."""
 import os
 
+import numcodecs
 import numpy as np
 import xarray as xr
 
-from . import downloader, utilities
+from . import _kernels, downloader, utilities
 
 
 def get_goes_band(satellite, region, channel, scan_time_utc, local_directory, s3=True):
@@ -54,9 +55,22 @@ def get_goes_band(satellite, region, channel, scan_time_utc, local_directory, s3
     raise ValueError(f"Could not find band. local: {len(local_filepaths)} files")
 
 
-def read_netcdf(local_filepath, transform_func=None):
+CHUNK_SIZE = {"x": 1024, "y": 1024}
+
+
+def read_netcdf(local_filepath, transform_func=None, zarr_cache=False):
     """Read the netcdf4 file defined at `local_filepath`.
 
+    The dataset is opened lazily in 1024x1024 dask chunks, so derived quantities like
+    the reflectance factor and brightness temperature build a computation graph that
+    is fused with the file read, overlapping I/O and compute tile by tile rather than
+    loading the full raster up front.
+
+    If `zarr_cache` is set, a chunk-matched Zarr copy of the dataset is kept at
+    `{local_filepath}.zarr` and preferred on subsequent reads, which skips netCDF
+    decompression on repeated runs (e.g. parameter sweeps and backfills) and allows
+    chunks to be read in parallel.
+
     If `transform_func` is provided, then transform dataset defined by `filepath` before
     returning.
 
@@ -65,17 +79,50 @@ def read_netcdf(local_filepath, transform_func=None):
     local_filepath : str
     transform_func : function
         f(xr.core.dataset.Dataset) -> (xr.core.dataset.Dataset)
+    zarr_cache : bool, optional
+        Whether to persist and prefer a Zarr copy of the dataset, by default False.
 
     Returns
     -------
     GoesBand
     """
-    dataset = xr.load_dataset(local_filepath)
+    if zarr_cache:
+        dataset = _read_zarr_cached(local_filepath=local_filepath)
+    else:
+        dataset = xr.open_dataset(
+            local_filepath, chunks=CHUNK_SIZE, engine="h5netcdf", cache=False
+        )
     if transform_func is not None:
         dataset = transform_func(dataset)
     return GoesBand(dataset=dataset)
 
 
+def _read_zarr_cached(local_filepath):
+    """Read the dataset at `local_filepath` via its Zarr cache, creating it if absent.
+
+    Parameters
+    ----------
+    local_filepath : str
+        Filepath of the source netcdf4 file.
+
+    Returns
+    -------
+    xr.core.dataset.Dataset
+    """
+    zarr_filepath = f"{local_filepath}.zarr"
+    if not os.path.exists(zarr_filepath):
+        dataset = xr.open_dataset(
+            local_filepath, chunks=CHUNK_SIZE, engine="h5netcdf", cache=False
+        )
+        compressor = numcodecs.Blosc(cname="zstd", clevel=1)
+        dataset.to_zarr(
+            zarr_filepath,
+            mode="w",
+            encoding={name: {"compressor": compressor} for name in dataset.data_vars},
+        )
+    return xr.open_zarr(zarr_filepath)
+
+
 class GoesBand:
     """Wrapper around the a single band of data from a GOES level 1 satellite scan.
 
@@ -108,7 +155,8 @@ class GoesBand:
             self.satellite,
             self.scan_time_utc,
         ) = utilities.parse_filename(filename=dataset.dataset_name)
-        self.band_wavelength_micrometers = dataset.band_wavelength.data[0]
+        # `float` forces the tiny dask-backed scalar to compute immediately
+        self.band_wavelength_micrometers = float(dataset.band_wavelength.data[0])
 
     def __repr__(self):
         """Represent a GoesBand object as a string."""
@@ -255,11 +303,18 @@ class GoesBand:
         -------
         xr.core.dataarray.DataArray
         """
-        dataarray = (
-            self.dataset.planck_fk2
-            / (np.log((self.dataset.planck_fk1 / self.dataset.Rad) + 1))
-            - self.dataset.planck_bc1
-        ) / self.dataset.planck_bc2
+        rad = self.dataset.Rad
+        planck_constants = {
+            constant: rad.dtype.type(self.dataset[constant])
+            for constant in ("planck_fk1", "planck_fk2", "planck_bc1", "planck_bc2")
+        }
+        dataarray = xr.apply_ufunc(
+            _brightness_temperature,
+            rad,
+            kwargs=planck_constants,
+            dask="parallelized",
+            output_dtypes=[rad.dtype],
+        )
         dataarray.attrs["long_name"] = "ABI L1b Brightness Temperature"
         dataarray.attrs["units"] = "Kelvin"
         return dataarray
@@ -315,6 +370,40 @@ class GoesBand:
         return local_filepath
 
 
+def _brightness_temperature(rad, planck_fk1, planck_fk2, planck_bc1, planck_bc2):
+    """Convert spectral radiance to brightness temperature in one fused pass.
+
+    The naive numpy expression allocates a full-size intermediate for each of the
+    division, log, subtraction, and final division; the numba kernel in `_kernels`
+    evaluates the whole expression per pixel, streaming `rad` through cache once
+    with a fast polynomial log in place of the transcendental call.
+
+    Parameters
+    ----------
+    rad : np.ndarray of float
+        Spectral radiance.
+    planck_fk1 : float
+    planck_fk2 : float
+    planck_bc1 : float
+    planck_bc2 : float
+
+    Returns
+    -------
+    np.ndarray of float
+        Brightness temperature (Kelvin), same shape and dtype as `rad`.
+    """
+    brightness_temperature = np.empty_like(rad)
+    _kernels.brightness_temperature(
+        rad,
+        float(planck_fk1),
+        float(planck_fk2),
+        float(planck_bc1),
+        float(planck_bc2),
+        brightness_temperature,
+    )
+    return brightness_temperature
+
+
 def filter_bad_pixels(dataset):
     """Use the Data Quality Flag (DQF) to filter out bad pixels.
 
@@ -1,7 +1,6 @@
 """Wrapper around the 16 bands of a GOES level 1 satellite scan."""
 import math
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from . import band, downloader, utilities
@@ -55,7 +54,7 @@ def get_goes_scan(satellite, region, scan_time_utc, local_directory, s3=True):
     raise ValueError(f"Could not find scan. local: {len(local_filepaths)} files")
 
 
-def read_netcdfs(local_filepaths, transform_func=None):
+def read_netcdfs(local_filepaths, transform_func=None, zarr_cache=False):
     """Read scan defined by `filepaths` from the local filesystem as GoesScan.
 
     If `transform_func` is provided, then transform datasets defined by `filepaths` before
@@ -66,6 +65,9 @@ def read_netcdfs(local_filepaths, transform_func=None):
     local_filepaths : list of str
     transform_func : function
         f(xr.core.dataset.Dataset) -> (xr.core.dataset.Dataset)
+    zarr_cache : bool, optional
+        Whether to persist and prefer a Zarr copy of each band, by default False. See
+        `band.read_netcdf`.
 
     Returns
     -------
@@ -73,7 +75,11 @@ def read_netcdfs(local_filepaths, transform_func=None):
     """
     return GoesScan(
         bands=[
-            band.read_netcdf(local_filepath=filepath, transform_func=transform_func)
+            band.read_netcdf(
+                local_filepath=filepath,
+                transform_func=transform_func,
+                zarr_cache=zarr_cache,
+            )
             for filepath in local_filepaths
         ]
     )
@@ -210,18 +216,44 @@ class GoesScan:
         GoesScan
             A `GoesScan` object where each band has been spatially rescaled to 2 km.
         """
+        return GoesScan(
+            bands=list(self.rescale_bands_to_2km(band_ids=range(1, 17)).values())
+        )
+
+    def rescale_bands_to_2km(self, band_ids):
+        """Scale only the requested bands to 2 kilometers.
+
+        `rescale_to_2km` rescales all 16 bands even when a caller only needs a few;
+        this variant touches just the bands of interest, skipping the rescale work
+        and allocations for the rest. See `rescale_to_2km` for the per-band source
+        resolutions and the note on approximated coordinates.
+
+        Parameters
+        ----------
+        band_ids : iterable of int
+            Each element must be between 1 and 16 inclusive.
+
+        Returns
+        -------
+        dict
+            Of the form:
+                {"band_{id}": wildfire.data.goes_level_1.GoesBand}
+            with every requested band spatially rescaled to 2 km.
+        """
+        band_ids = list(band_ids)
+        _assert_correct_bands(bands=band_ids)
         band_16_coords = {
             "x": self["band_16"].dataset.x.values,
             "y": self["band_16"].dataset.y.values,
         }
-        return GoesScan(
-            bands=[
-                band.GoesBand(
-                    band_ds.rescale_to_2km().dataset.assign_coords(**band_16_coords)
-                )
-                for _, band_ds in self.iteritems()
-            ]
-        )
+        return {
+            f"band_{band_id}": band.GoesBand(
+                dataset=self[f"band_{band_id}"]
+                .rescale_to_2km()
+                .dataset.assign_coords(**band_16_coords)
+            )
+            for band_id in band_ids
+        }
 
     def to_netcdf(self, directory):
         """Persist a netcdf4 file for each band.
@@ -264,6 +296,9 @@ class GoesScan:
         -------
         list of plt.image.AxesImage
         """
+        # deferred so worker processes that never plot skip the matplotlib import
+        import matplotlib.pyplot as plt
+
         _assert_correct_bands(bands=bands)
         max_cols = 3
 
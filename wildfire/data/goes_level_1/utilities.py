@@ -1,12 +1,11 @@
 """Common utilities for the GOES level 1 data.."""
 import datetime
+import functools
 import glob
 import logging
 import os
 import re
 
-import numpy as np
-
 from wildfire import multiprocessing
 
 SATELLITE_SHORT_HAND = {"noaa-goes16": "G16", "noaa-goes17": "G17"}
@@ -23,7 +22,7 @@ BASE_PATTERN_FORMAT = os.path.join(
 _logger = logging.getLogger(__name__)
 
 
-def group_filepaths_into_scans(filepaths):
+def group_filepaths_into_scans(filepaths, include_metadata=False):
     """Group bands in `filepaths` that belong to the same scan.
 
     A scan is defined as files that have the same satellite, region, and scan start time.
@@ -31,18 +30,25 @@ def group_filepaths_into_scans(filepaths):
     Parameters
     ----------
     filepaths : list of str
+    include_metadata : bool, optional
+        Whether to return each group as a `((satellite, region, started_at), group)`
+        tuple instead of the bare group, by default False. The metadata tuple is
+        derived here from a single parse of each filepath and can be shipped to
+        workers so they need not reparse the same filepaths.
 
     Returns
     -------
-    list of list of str
-        Each sublist is a specific scan.
+    list of list of str | list of (tuple, list of str)
+        Each group is a specific scan, ordered by satellite, region, and scan start
+        time.
     """
-    scan_times = [parse_filename(filepath)[3] for filepath in filepaths]
-    unique_scan_times, unique_indices = np.unique(scan_times, return_inverse=True)
-    groups = [[] for i in range(len(unique_scan_times))]
-    for scan_time_idx, unique_idx in enumerate(unique_indices):
-        groups[unique_idx].append(filepaths[scan_time_idx])
-    return groups
+    groups = {}
+    for filepath in filepaths:
+        region, _, satellite, started_at = parse_filename(filename=filepath)
+        groups.setdefault((satellite, region, started_at), []).append(filepath)
+    if include_metadata:
+        return sorted(groups.items())
+    return [group for _, group in sorted(groups.items())]
 
 
 def decide_fastest_glob_patterns(
@@ -220,9 +226,14 @@ def list_local_files(
     return filepaths
 
 
+@functools.lru_cache(maxsize=None)
 def parse_filename(filename):
     """Parse region, channel, satellite and started_at from filename.
 
+    A pure function of its string argument, so results are memoized; batch runs call
+    this with the same filepaths many times over (grouping, per-band construction,
+    scan validation), and the cache skips the repeated regex and datetime parsing.
+
     Parameters
     ----------
     filename : str
@@ -6,5 +6,6 @@ from .model import (
     is_hot_pixel,
     is_water_pixel,
     predict,
+    predict_packed,
 )
 from .goes_level_1_wildfires import label_wildfires
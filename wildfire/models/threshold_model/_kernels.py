@@ -0,0 +1,156 @@
+"""Fused numba kernels for the threshold model's pixel classifiers.
+
+The four `is_*_pixel` classifiers in `model.py` each traverse the full 2km rasters
+and materialize intermediate boolean arrays. Fusing them into a single kernel reads
+each band exactly once and writes one bit-packed `uint8` feature code per pixel in
+the same pass, which cuts memory traffic roughly 4x on these memory-bound arrays
+and shrinks the feature storage another 4x versus four boolean masks.
+"""
+import numpy as np
+from numba import njit, prange
+
+from . import _kernels_gpu
+
+try:
+    # native extension built by _kernels_aot.py; imports in milliseconds, whereas
+    # loading the JIT build from cache can cost seconds per worker process
+    from .threshold_kernels import classify as _classify_aot
+except ImportError:
+    _classify_aot = None
+
+
+def classify(
+    brightness_temperature_3_89,
+    brightness_temperature_11_19,
+    brightness_temperature_12_27,
+    reflectance_factor_0_64,
+    reflectance_factor_0_87,
+    reflectance_factor_2_25,
+):
+    """Evaluate all four threshold-model pixel classifiers in a single fused pass.
+
+    Equivalent to calling `model.is_hot_pixel`, `model.is_night_pixel`,
+    `model.is_water_pixel`, and `model.is_cloud_pixel` on the same inputs and packing
+    the results bitwise, but each band is read from memory only once and no
+    intermediate arrays are allocated.
+
+    Parameters
+    ----------
+    brightness_temperature_3_89 : np.ndarray of float
+        Brightness temperature (Kelvin) of band 7.
+    brightness_temperature_11_19 : np.ndarray of float
+        Brightness temperature (Kelvin) of band 14.
+    brightness_temperature_12_27 : np.ndarray of float
+        Brightness temperature (Kelvin) of band 15.
+    reflectance_factor_0_64 : np.ndarray of float
+        Reflectance factor of band 2.
+    reflectance_factor_0_87 : np.ndarray of float
+        Reflectance factor of band 3.
+    reflectance_factor_2_25 : np.ndarray of float
+        Reflectance factor of band 6.
+
+    Returns
+    -------
+    np.ndarray of np.uint8
+        Bit-packed feature codes with the shape of the inputs; see
+        `model.ModelFeatures` for the bit layout.
+    """
+    if (
+        brightness_temperature_3_89.size > _kernels_gpu.SIZE_THRESHOLD
+        and _kernels_gpu.is_available()
+    ):
+        return _kernels_gpu.classify(
+            brightness_temperature_3_89,
+            brightness_temperature_11_19,
+            brightness_temperature_12_27,
+            reflectance_factor_0_64,
+            reflectance_factor_0_87,
+            reflectance_factor_2_25,
+        )
+
+    codes = np.empty(brightness_temperature_3_89.shape, dtype=np.uint8)
+
+    # `is_hot_pixel` normalizes its inputs, so the global mean and standard deviation
+    # are computed up front and passed to the kernel as scalars.
+    temperature_difference = brightness_temperature_3_89 - brightness_temperature_11_19
+
+    bands = (
+        brightness_temperature_3_89,
+        brightness_temperature_11_19,
+        brightness_temperature_12_27,
+        reflectance_factor_0_64,
+        reflectance_factor_0_87,
+        reflectance_factor_2_25,
+    )
+    kernel = _classify
+    if _classify_aot is not None and all(band.dtype == np.float32 for band in bands):
+        kernel = _classify_aot
+    kernel(
+        *bands,
+        float(brightness_temperature_3_89.mean()),
+        float(brightness_temperature_3_89.std()),
+        float(temperature_difference.mean()),
+        float(temperature_difference.std()),
+        codes,
+    )
+    return codes
+
+
+# 512x512 tiles keep the working set of all 6 float bands plus the output within
+# L2 across the whole predicate evaluation, instead of streaming full rasters
+# through DRAM for each band.
+TILE_SIZE = 512
+
+
+# fastmath is restricted to flags that preserve NaN semantics; comparisons against
+# NaN pixels must stay False to match the numpy classifiers.
+@njit(parallel=True, cache=True, fastmath={"contract", "arcp", "reassoc"})
+def _classify(
+    bt_3_89,
+    bt_11_19,
+    bt_12_27,
+    rf_0_64,
+    rf_0_87,
+    rf_2_25,
+    bt_3_89_mean,
+    bt_3_89_std,
+    bt_diff_mean,
+    bt_diff_std,
+    codes,
+):
+    num_rows, num_cols = bt_3_89.shape
+    num_tile_rows = (num_rows + TILE_SIZE - 1) // TILE_SIZE
+    num_tile_cols = (num_cols + TILE_SIZE - 1) // TILE_SIZE
+    for tile in prange(  # pylint: disable=not-an-iterable
+        num_tile_rows * num_tile_cols
+    ):
+        row_start = (tile // num_tile_cols) * TILE_SIZE
+        col_start = (tile % num_tile_cols) * TILE_SIZE
+        row_stop = min(row_start + TILE_SIZE, num_rows)
+        col_stop = min(col_start + TILE_SIZE, num_cols)
+        for row in range(row_start, row_stop):
+            for col in range(col_start, col_stop):
+                bt7 = bt_3_89[row, col]
+                bt14 = bt_11_19[row, col]
+                bt15 = bt_12_27[row, col]
+                rf2 = rf_0_64[row, col]
+                rf3 = rf_0_87[row, col]
+                rf6 = rf_2_25[row, col]
+
+                is_hot = ((bt7 - bt_3_89_mean) / bt_3_89_std > 2) & (
+                    ((bt7 - bt14) - bt_diff_mean) / bt_diff_std > 3
+                )
+                is_night = (abs(rf2) < 0.008) | (abs(rf3) < 0.008)
+                is_water = rf6 <= 0.03
+                is_cloud = (
+                    (rf2 + rf3 >= 1.2)
+                    | (bt15 <= 265)
+                    | ((rf2 + rf3 >= 0.5) & (bt15 <= 285))
+                )
+                # bit layout must match the *_BIT constants in model.py
+                codes[row, col] = (
+                    np.uint8(is_hot)
+                    | (np.uint8(is_night) << 1)
+                    | (np.uint8(is_water) << 2)
+                    | (np.uint8(is_cloud) << 3)
+                )
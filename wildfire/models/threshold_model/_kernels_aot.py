@@ -0,0 +1,37 @@
+"""Ahead-of-time compilation of the threshold-model classifier kernel.
+
+Every worker process that imports the JIT'd kernel pays a load-from-cache (or worse,
+a recompile) on first use, which adds up to seconds per worker across the hundreds
+of workers a PBS run launches. Compiling the kernel into a `threshold_kernels`
+extension module ships native code that workers import with zero JIT overhead;
+`_kernels` prefers it when present and falls back to the JIT build otherwise.
+
+Build it in place with either of:
+
+    python -m wildfire.models.threshold_model._kernels_aot
+    python setup.py build_ext --inplace
+
+Note the AOT build compiles `prange` serially (numba's AOT path does not support
+`parallel=True`), trading peak per-call throughput for instant worker startup.
+"""
+import os
+
+from numba.pycc import CC
+
+from . import _kernels
+
+cc = CC("threshold_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# float32 rasters only; `_kernels.classify` routes other dtypes to the JIT build
+_CLASSIFY_SIGNATURE = (
+    "void(f4[:,:], f4[:,:], f4[:,:], f4[:,:], f4[:,:], f4[:,:], f8, f8, f8, f8,"
+    " u1[:,:])"
+)
+cc.export("classify", _CLASSIFY_SIGNATURE)(
+    _kernels._classify.py_func  # pylint: disable=protected-access
+)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,115 @@
+"""Optional CuPy backend for the threshold model's fused pixel classifier.
+
+Per-pixel threshold classification is embarrassingly data-parallel with trivial
+arithmetic, which suits a GPU far better than a CPU once the rasters are large
+enough to amortize the host-to-device transfer — a 2km full-disk scan is ~29M
+pixels per band. The whole classification runs as a single CUDA kernel and only
+the packed uint8 codes travel back to the host.
+
+CuPy is an optional dependency: `_kernels.classify` only routes here when `cupy`
+imports and a CUDA device is present.
+"""
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+# route rasters past this many pixels to the GPU; below it (e.g. mesoscale scans)
+# the transfer overhead outweighs the kernel speedup
+SIZE_THRESHOLD = 4_000_000
+
+_classify_kernel = None
+
+
+def is_available():
+    """Whether cupy is importable and a CUDA device is present.
+
+    Returns
+    -------
+    bool
+    """
+    if cp is None:
+        return False
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except cp.cuda.runtime.CUDARuntimeError:
+        return False
+
+
+def classify(
+    brightness_temperature_3_89,
+    brightness_temperature_11_19,
+    brightness_temperature_12_27,
+    reflectance_factor_0_64,
+    reflectance_factor_0_87,
+    reflectance_factor_2_25,
+):
+    """Evaluate all four pixel classifiers in one CUDA kernel.
+
+    The device-side equivalent of `_kernels.classify`: the six bands are shipped to
+    the GPU, classified by a single fused elementwise kernel, and only the packed
+    uint8 codes are copied back.
+
+    Parameters
+    ----------
+    brightness_temperature_3_89 : np.ndarray of float
+    brightness_temperature_11_19 : np.ndarray of float
+    brightness_temperature_12_27 : np.ndarray of float
+    reflectance_factor_0_64 : np.ndarray of float
+    reflectance_factor_0_87 : np.ndarray of float
+    reflectance_factor_2_25 : np.ndarray of float
+
+    Returns
+    -------
+    np.ndarray of np.uint8
+        Bit-packed feature codes on the host; see `model.ModelFeatures`.
+    """
+    bt_3_89 = cp.asarray(brightness_temperature_3_89, dtype=cp.float32)
+    bt_11_19 = cp.asarray(brightness_temperature_11_19, dtype=cp.float32)
+    bt_12_27 = cp.asarray(brightness_temperature_12_27, dtype=cp.float32)
+    rf_0_64 = cp.asarray(reflectance_factor_0_64, dtype=cp.float32)
+    rf_0_87 = cp.asarray(reflectance_factor_0_87, dtype=cp.float32)
+    rf_2_25 = cp.asarray(reflectance_factor_2_25, dtype=cp.float32)
+
+    temperature_difference = bt_3_89 - bt_11_19
+    codes = _get_classify_kernel()(
+        bt_3_89,
+        bt_11_19,
+        bt_12_27,
+        rf_0_64,
+        rf_0_87,
+        rf_2_25,
+        float(bt_3_89.mean()),
+        float(bt_3_89.std()),
+        float(temperature_difference.mean()),
+        float(temperature_difference.std()),
+    )
+    return cp.asnumpy(codes)
+
+
+def _get_classify_kernel():
+    """Build the fused elementwise kernel once per process."""
+    global _classify_kernel  # pylint: disable=global-statement
+    if _classify_kernel is None:
+        # predicates and bit layout must match _kernels._classify
+        _classify_kernel = cp.ElementwiseKernel(
+            "float32 bt7, float32 bt14, float32 bt15, float32 rf2, float32 rf3,"
+            " float32 rf6, float64 bt_mean, float64 bt_std, float64 diff_mean,"
+            " float64 diff_std",
+            "uint8 code",
+            """
+            const bool is_hot = ((bt7 - bt_mean) / bt_std > 2.0)
+                && (((double)(bt7 - bt14) - diff_mean) / diff_std > 3.0);
+            const bool is_night = (fabs((double)rf2) < 0.008)
+                || (fabs((double)rf3) < 0.008);
+            const bool is_water = rf6 <= 0.03;
+            const bool is_cloud = (rf2 + rf3 >= 1.2) || (bt15 <= 265.0)
+                || ((rf2 + rf3 >= 0.5) && (bt15 <= 285.0));
+            code = (unsigned char)is_hot
+                | ((unsigned char)is_night << 1)
+                | ((unsigned char)is_water << 2)
+                | ((unsigned char)is_cloud << 3);
+            """,
+            "wildfire_threshold_classify",
+        )
+    return _classify_kernel
@@ -1,18 +1,23 @@
 """Utilities combining goes level 1 data and wildfire modelling."""
+import concurrent.futures
 import datetime
-import json
 import logging
+import multiprocessing as std_multiprocessing
 import os
 
-import matplotlib.pyplot as plt
 import numpy as np
+import orjson
 
 from wildfire import multiprocessing
 from wildfire.data import goes_level_1
+from wildfire.data.goes_level_1 import _kernels as _goes_kernels
+from . import _kernels
 from . import model as threshold_model
 
-WILDFIRE_FILENAME = "wildfires_{satellite}_{region}_s{start}_e{end}_c{created}.json"
+WILDFIRE_FILENAME = "wildfires_{satellite}_{region}_s{start}_e{end}_c{created}.jsonl"
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+# the bands the threshold model classifies on; see `get_model_features`
+MODEL_BAND_IDS = (2, 3, 6, 7, 14, 15)
 
 _logger = logging.getLogger(__name__)
 
@@ -39,32 +44,116 @@ def find_wildfires(filepaths, pbs=False, **cluster_kwargs):
         complete scan.
     """
     _logger.info("Grouping files into scans...")
-    scan_filepaths = goes_level_1.utilities.group_filepaths_into_scans(
-        filepaths=filepaths
+    scan_tasks = goes_level_1.utilities.group_filepaths_into_scans(
+        filepaths=filepaths, include_metadata=True
     )
 
     _logger.info(
-        "Processing %d scans with %d workers...", len(scan_filepaths), os.cpu_count()
+        "Processing %d scans with %d workers...", len(scan_tasks), os.cpu_count()
     )
-    wildfires = multiprocessing.map_function(
-        function=parse_scan_for_wildfire,
-        function_args=[scan_filepaths],
-        pbs=pbs,
-        **cluster_kwargs,
-    )
-    wildfires = list(filter(None, wildfires))
+    wildfires = [
+        wildfire
+        for wildfire in _parse_scans(
+            function=_parse_scan_task, tasks=scan_tasks, pbs=pbs, **cluster_kwargs
+        )
+        if wildfire is not None
+    ]
 
     _logger.info("Found %d wildfires.", len(wildfires))
     return wildfires
 
 
-def parse_scan_for_wildfire(filepaths):
+def _parse_scans(function, tasks, pbs=False, **cluster_kwargs):
+    """Run a scan-parsing function over every task, in parallel where it pays off.
+
+    On PBS, defer to the dask-backed `multiprocessing.map_function`. Locally, a single
+    scan is parsed in-process to avoid pool startup entirely, and larger batches use a
+    `ProcessPoolExecutor` with forked workers and a tuned chunksize so short tasks
+    don't pay per-task interpreter startup or IPC overhead.
+
+    Parameters
+    ----------
+    function : function
+        f(task) -> (dict | None). Must be picklable, i.e. module-level.
+    tasks : list
+        One element per scan.
+    pbs : bool, optional
+        Whether or not to launch and parallize using PBS, by default False.
+
+    Returns
+    -------
+    iterator of (dict | None)
+    """
+    if pbs:
+        yield from multiprocessing.map_function(
+            function=function, function_args=[tasks], pbs=pbs, **cluster_kwargs,
+        )
+        return
+
+    if len(tasks) == 1:
+        yield function(tasks[0])
+        return
+
+    # forked workers inherit the parent's imported modules, skipping the expensive
+    # numpy/xarray reimport that the default start method pays on macOS/Windows
+    start_methods = std_multiprocessing.get_all_start_methods()
+    mp_context = std_multiprocessing.get_context(
+        "fork" if "fork" in start_methods else None
+    )
+    chunksize = max(1, len(tasks) // (os.cpu_count() * 4))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=mp_context,
+        initializer=_preload_worker,
+    ) as executor:
+        yield from executor.map(function, tasks, chunksize=chunksize)
+
+
+def _preload_worker():
+    """Warm a freshly started worker before it receives its first scan.
+
+    Calling the numba kernels on tiny inputs triggers their load-from-cache (or
+    compile) once per worker, at startup, instead of adding seconds of latency to
+    the worker's first real task. Workers persist for the life of the pool, so the
+    cost is paid exactly once each.
+    """
+    tiny = np.ones((2, 2), dtype=np.float32)
+    with np.errstate(invalid="ignore"):
+        _kernels.classify(tiny, tiny, tiny, tiny, tiny, tiny)
+        _goes_kernels.brightness_temperature(
+            tiny, 1.0, 1.0, 0.0, 1.0, np.empty_like(tiny)
+        )
+
+
+def _parse_scan_task(task):
+    """Unpack a `(metadata, filepaths)` task emitted by the metadata-aware grouper.
+
+    Parameters
+    ----------
+    task : tuple of (tuple, list of str)
+        `((satellite, region, started_at), filepaths)` as produced by
+        `group_filepaths_into_scans(..., include_metadata=True)`.
+
+    Returns
+    -------
+    dict | None
+        See `parse_scan_for_wildfire`.
+    """
+    scan_metadata, filepaths = task
+    return parse_scan_for_wildfire(filepaths=filepaths, scan_metadata=scan_metadata)
+
+
+def parse_scan_for_wildfire(filepaths, scan_metadata=None):
     """Determine if scan defined by `filepaths` has a wildfire.
 
     Parameters
     ----------
     filepaths : list of str
         Must be a set of 16 files, which together define the 16 bands of a complete scan.
+    scan_metadata : tuple of (str, str, datetime.datetime), optional
+        `(satellite, region, started_at)` already parsed upstream by the grouper;
+        when provided, the wildfire record is built from it directly rather than
+        re-derived from the scan.
 
     Returns
     -------
@@ -78,30 +167,95 @@ def parse_scan_for_wildfire(filepaths):
         which can be used to uniquely identify the set of 16 files that comprise a
         complete scan.
     """
-    try:
-        goes_scan = goes_level_1.scan.read_netcdfs(local_filepaths=filepaths)
-    except ValueError as error_message:
-        _logger.warning(
-            "\nSkipping malformed goes_scan comprised of %s.\nError: %s",
-            filepaths,
-            error_message,
-        )
+    if not _is_complete_scan(filepaths=filepaths):
         return None
 
-    if predict_wildfires(goes_scan=goes_scan).mean() > 0:
+    goes_scan = goes_level_1.scan.read_netcdfs(local_filepaths=filepaths)
+    if bool(np.any(predict_wildfires(goes_scan=goes_scan))):
+        if scan_metadata is not None:
+            satellite, region, scan_time_utc = scan_metadata
+        else:
+            satellite, region, scan_time_utc = (
+                goes_scan.satellite,
+                goes_scan.region,
+                goes_scan.scan_time_utc,
+            )
         return {
-            "scan_time_utc": goes_scan.scan_time_utc.strftime("%Y-%m-%dT%H:%M:%S%f"),
-            "region": goes_scan.region,
-            "satellite": goes_scan.satellite,
+            "scan_time_utc": scan_time_utc.strftime("%Y-%m-%dT%H:%M:%S%f"),
+            "region": region,
+            "satellite": satellite,
         }
     return None
 
 
+def _is_complete_scan(filepaths):
+    """Validate that `filepaths` forms a complete 16-band scan, before any I/O.
+
+    Replaces the exception-based fallback that used to wrap the scan read:
+    malformed groups are rejected from the (memoized) filename parses alone,
+    without opening a single file and without exception handling on the per-scan
+    hot path.
+
+    Parameters
+    ----------
+    filepaths : list of str
+
+    Returns
+    -------
+    bool
+        Whether `filepaths` has all 16 bands of exactly one scan. Problems are
+        logged as warnings.
+    """
+    if len(filepaths) != 16:
+        _logger.warning(
+            "\nSkipping malformed goes_scan comprised of %s.\nExpected 16 files; "
+            "got %d.",
+            filepaths,
+            len(filepaths),
+        )
+        return False
+
+    try:
+        parsed = [
+            goes_level_1.utilities.parse_filename(filename=filepath)
+            for filepath in filepaths
+        ]
+    except AttributeError:
+        _logger.warning(
+            "\nSkipping malformed goes_scan comprised of %s.\nCould not parse all "
+            "filenames.",
+            filepaths,
+        )
+        return False
+
+    channels = {channel for _, channel, _, _ in parsed}
+    if channels != set(range(1, 17)):
+        _logger.warning(
+            "\nSkipping malformed goes_scan comprised of %s.\nMissing bands: %s.",
+            filepaths,
+            set(range(1, 17)) - channels,
+        )
+        return False
+
+    attributes = {
+        (satellite, region, started_at) for region, _, satellite, started_at in parsed
+    }
+    if len(attributes) != 1:
+        _logger.warning(
+            "\nSkipping malformed goes_scan comprised of %s.\nFiles span multiple "
+            "scans: %s.",
+            filepaths,
+            attributes,
+        )
+        return False
+    return True
+
+
 def get_model_features(goes_scan):
     """Calculate features of the threshold model from a `GoesScan`.
 
-    To do this, the provided `GoesScan` is first rescaled such that all bands are in the
-    same spatial resoltuion (namely 500m).
+    To do this, the bands the model uses are first rescaled to the same spatial
+    resolution (namely 2km); the other 10 bands of the scan are left untouched.
 
     Parameters
     ----------
@@ -111,36 +265,52 @@ def get_model_features(goes_scan):
     Returns
     -------
     wildfire.models.threshold_model.ModelFeatures
-        Namedtuple of features used as input to the `predict` method.
+        Bit-packed features used as input to the `predict_packed` method.
     """
-    rescaled_scan = goes_scan.rescale_to_2km()
+    rescaled_scan = goes_scan.rescale_bands_to_2km(band_ids=MODEL_BAND_IDS)
 
     with np.errstate(invalid="ignore"):
-        is_hot = threshold_model.is_hot_pixel(
-            brightness_temperature_3_89=rescaled_scan[
-                "band_7"
-            ].brightness_temperature.data,
-            brightness_temperature_11_19=rescaled_scan[
-                "band_14"
-            ].brightness_temperature.data,
-        )
-        is_night = threshold_model.is_night_pixel(
-            reflectance_factor_0_64=rescaled_scan["band_2"].reflectance_factor.data,
-            reflectance_factor_0_87=rescaled_scan["band_3"].reflectance_factor.data,
-        )
-        is_water = threshold_model.is_water_pixel(
-            reflectance_factor_2_25=rescaled_scan["band_6"].reflectance_factor.data
-        )
-        is_cloud = threshold_model.is_cloud_pixel(
-            reflectance_factor_0_64=rescaled_scan["band_2"].reflectance_factor.data,
-            reflectance_factor_0_87=rescaled_scan["band_3"].reflectance_factor.data,
-            brightness_temperature_12_27=rescaled_scan[
-                "band_15"
-            ].brightness_temperature.data,
+        codes = _kernels.classify(
+            brightness_temperature_3_89=_materialize_float32(
+                rescaled_scan["band_7"].brightness_temperature
+            ),
+            brightness_temperature_11_19=_materialize_float32(
+                rescaled_scan["band_14"].brightness_temperature
+            ),
+            brightness_temperature_12_27=_materialize_float32(
+                rescaled_scan["band_15"].brightness_temperature
+            ),
+            reflectance_factor_0_64=_materialize_float32(
+                rescaled_scan["band_2"].reflectance_factor
+            ),
+            reflectance_factor_0_87=_materialize_float32(
+                rescaled_scan["band_3"].reflectance_factor
+            ),
+            reflectance_factor_2_25=_materialize_float32(
+                rescaled_scan["band_6"].reflectance_factor
+            ),
         )
-    return threshold_model.ModelFeatures(
-        is_hot=is_hot, is_night=is_night, is_water=is_water, is_cloud=is_cloud,
-    )
+    return threshold_model.ModelFeatures(codes=codes)
+
+
+def _materialize_float32(dataarray):
+    """Compute a possibly dask-backed DataArray into a float32 numpy array.
+
+    The classifier thresholds need nowhere near float64 precision, and halving the
+    element size halves the bytes the memory-bound kernel pulls through DRAM. The
+    cast is appended to the lazy graph (a no-op for data already in float32), and
+    everything upstream (file read, rescale, Planck math) computes as one fused
+    graph per band.
+
+    Parameters
+    ----------
+    dataarray : xr.core.dataarray.DataArray
+
+    Returns
+    -------
+    np.ndarray of np.float32
+    """
+    return np.asarray(dataarray.data.astype(np.float32, copy=False))
 
 
 def predict_wildfires(goes_scan):
@@ -156,13 +326,7 @@ def predict_wildfires(goes_scan):
         A prediction (True/False) of whether a wildfire is detected at each pixel.
     """
     model_features = get_model_features(goes_scan=goes_scan)
-    model_predictions = threshold_model.predict(
-        is_hot=model_features.is_hot,
-        is_cloud=model_features.is_cloud,
-        is_night=model_features.is_night,
-        is_water=model_features.is_water,
-    )
-    return model_predictions
+    return threshold_model.predict_packed(codes=model_features.codes)
 
 
 def plot_wildfires(goes_scan):
@@ -176,10 +340,15 @@ def plot_wildfires(goes_scan):
     -------
     list of plt.image.AxesImage
     """
+    # deferred so worker processes that never plot skip the matplotlib import
+    import matplotlib.pyplot as plt
+
     model_predictions = predict_wildfires(goes_scan=goes_scan)
 
     _, (axis_fire, axis_scan) = plt.subplots(ncols=2, figsize=(20, 8))
-    axis_fire.set_title(f"Wildfire Present: {model_predictions.mean() > 0}", fontsize=20)
+    axis_fire.set_title(
+        f"Wildfire Present: {bool(np.any(model_predictions))}", fontsize=20
+    )
 
     image_fire = axis_fire.imshow(model_predictions)
     image_scan = goes_scan["band_7"].plot(axis=axis_scan)
@@ -200,7 +369,11 @@ def label_wildfires(
     pbs=False,
     **cluster_kwargs,
 ):
-    """Create a list of all scans that have wildfires.
+    """Persist a record of every scan that has a wildfire.
+
+    Records are streamed to a JSON-lines file in `persist_directory` as scans
+    complete, one JSON object per line, so memory usage stays constant regardless of
+    how many scans are labelled.
 
     Parameters
     ----------
@@ -217,32 +390,45 @@ def label_wildfires(
 
     Returns
     -------
-    dict
+    int
+        The number of wildfires found.
     """
-    wildfires = multiprocessing.map_function(
-        function=parse_scan_for_wildfire,
-        function_args=[scan_filepaths],
-        pbs=pbs,
-        **cluster_kwargs,
+    wildfires_filepath = os.path.join(
+        persist_directory,
+        WILDFIRE_FILENAME.format(
+            satellite=satellite,
+            region=region,
+            start=start.strftime(DATETIME_FORMAT),
+            end=end.strftime(DATETIME_FORMAT),
+            created=datetime.datetime.utcnow().strftime(DATETIME_FORMAT),
+        ),
     )
-    wildfires = list(filter(None, wildfires))
-    _logger.info("Found %d wildfires.", len(wildfires))
 
-    if len(wildfires) > 0:
-        wildfires_filepath = os.path.join(
-            persist_directory,
-            WILDFIRE_FILENAME.format(
-                satellite=satellite,
-                region=region,
-                start=start.strftime(DATETIME_FORMAT),
-                end=end.strftime(DATETIME_FORMAT),
-                created=datetime.datetime.utcnow().strftime(DATETIME_FORMAT),
-            ),
-        )
-        _logger.info("Persisting wildfires to %s", wildfires_filepath)
-        with open(wildfires_filepath, "w+") as buffer:
-            json.dump(dict(enumerate(wildfires)), buffer)
+    num_wildfires = 0
+    buffer = None
+    try:
+        # write each wildfire as a JSON line the moment its scan completes, so
+        # memory stays constant no matter how many scans the date range covers
+        for wildfire in _parse_scans(
+            function=parse_scan_for_wildfire,
+            tasks=scan_filepaths,
+            pbs=pbs,
+            **cluster_kwargs,
+        ):
+            if wildfire is None:
+                continue
+            if buffer is None:
+                _logger.info("Persisting wildfires to %s", wildfires_filepath)
+                buffer = open(wildfires_filepath, "wb")
+            buffer.write(orjson.dumps(wildfire) + b"\n")
+            num_wildfires += 1
+    finally:
+        if buffer is not None:
+            buffer.close()
+
+    if num_wildfires > 0:
+        _logger.info("Found %d wildfires.", num_wildfires)
     else:
         _logger.info("No wildfires found...")
 
-    return wildfires
+    return num_wildfires
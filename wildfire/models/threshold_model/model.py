@@ -1,13 +1,60 @@
 """Threshold model for predicting wildfires."""
-from collections import namedtuple
-
 import numpy as np
 
 from wildfire.data import goes_level_1
 
-ModelFeatures = namedtuple(
-    "ModelFeatures", ("is_hot", "is_cloud", "is_water", "is_night")
-)
+HOT_BIT = 1
+NIGHT_BIT = 2
+WATER_BIT = 4
+CLOUD_BIT = 8
+
+
+class ModelFeatures:
+    """Bit-packed boolean features used as input to the threshold model.
+
+    The four per-pixel predicates are stored as one `uint8` code per pixel rather
+    than four full-size boolean arrays, quartering the feature memory footprint. The
+    individual masks remain available as lazily-unpacked properties.
+
+    Attributes
+    ----------
+    codes : np.ndarray of np.uint8
+        2 dimensional array of feature codes, one per pixel, with bit layout
+        `is_hot | is_night << 1 | is_water << 2 | is_cloud << 3`.
+    """
+
+    def __init__(self, codes):
+        """Initialize.
+
+        Parameters
+        ----------
+        codes : np.ndarray of np.uint8
+        """
+        self.codes = codes
+
+    @property
+    def is_hot(self):
+        """Unpack whether each pixel is "hot". Corresponds to `is_hot_pixel()`."""
+        return (self.codes & HOT_BIT) > 0
+
+    @property
+    def is_night(self):
+        """Unpack whether each pixel is at "night". Corresponds to `is_night_pixel()`."""
+        return (self.codes & NIGHT_BIT) > 0
+
+    @property
+    def is_water(self):
+        """Unpack whether each pixel is in "water". Corresponds to `is_water_pixel()`."""
+        return (self.codes & WATER_BIT) > 0
+
+    @property
+    def is_cloud(self):
+        """Unpack whether each pixel is in a "cloud". Corresponds to `is_cloud_pixel()`."""
+        return (self.codes & CLOUD_BIT) > 0
+
+    def __iter__(self):
+        """Iterate over the unpacked masks in the historical field order."""
+        return iter((self.is_hot, self.is_cloud, self.is_water, self.is_night))
 
 
 def predict(is_hot, is_cloud, is_water, is_night):
@@ -44,6 +91,26 @@ def predict(is_hot, is_cloud, is_water, is_night):
     return is_hot & (is_night | (~is_cloud & ~is_water))
 
 
+def predict_packed(codes):
+    """Predict the occurrence of a wildfire from bit-packed feature codes.
+
+    Since the prediction is a boolean function of the 4 feature bits, it reduces to
+    one lookup per pixel into a 16-entry table, instead of the four full-array
+    logical ops `predict` performs on unpacked masks.
+
+    Parameters
+    ----------
+    codes : np.ndarray of np.uint8
+        2 dimensional array of feature codes, as stored by `ModelFeatures`.
+
+    Returns
+    -------
+    np.ndarray of bool
+        2 dimensional array representing whether each pixel in the array is in a wildfire.
+    """
+    return _PREDICTION_LUT[codes]
+
+
 def is_hot_pixel(brightness_temperature_3_89, brightness_temperature_11_19):
     """Classiify the pixels of an image as whether they are "hot".
 
@@ -140,3 +207,16 @@ def _assert_shapes_match(*args):
     shapes = {arg.shape for arg in args}
     if len(shapes) != 1:
         raise ValueError(f"Shapes do no match! Got shapes {shapes}")
+
+
+def _build_prediction_lut():
+    codes = np.arange(16, dtype=np.uint8)
+    return predict(
+        is_hot=(codes & HOT_BIT) > 0,
+        is_cloud=(codes & CLOUD_BIT) > 0,
+        is_water=(codes & WATER_BIT) > 0,
+        is_night=(codes & NIGHT_BIT) > 0,
+    )
+
+
+_PREDICTION_LUT = _build_prediction_lut()